@@ -84,6 +84,52 @@ def test_extract_durations_supports_microseconds(tmp_path: Path):
     assert stream.malformed_count == 0
 
 
+def test_extract_durations_handles_quoted_fields(tmp_path: Path):
+    input_path = tmp_path / "quoted.csv"
+    with input_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["Note", "Duration"])
+        writer.writerow(["hello, world", "100ms"])
+        writer.writerow(["plain", "2s"])
+
+    stream = extract_durations(input_path)
+    values = list(stream)
+
+    assert values == ["100", "2000"]
+    assert stream.processed_count == 2
+    assert stream.skipped_count == 0
+    assert stream.malformed_count == 0
+
+
+def test_extract_durations_skips_unicode_whitespace_cells(tmp_path: Path):
+    input_path = tmp_path / "nbsp.csv"
+    input_path.write_text("Duration\n \n100ms\n", encoding="utf-8")
+
+    stream = extract_durations(input_path)
+    values = list(stream)
+
+    assert values == ["100"]
+    assert stream.skipped_count == 1
+    assert stream.malformed_count == 0
+
+
+def test_extract_durations_handles_quoted_field_deep_in_file(tmp_path: Path):
+    input_path = tmp_path / "quoted_late.csv"
+    with input_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["Note", "Duration"])
+        writer.writerow(["x" * (128 * 1024), "100ms"])
+        writer.writerow(["hello, world", "250ms"])
+        writer.writerow(["plain", "2s"])
+
+    stream = extract_durations(input_path)
+    values = list(stream)
+
+    assert values == ["100", "250", "2000"]
+    assert stream.processed_count == 3
+    assert stream.malformed_count == 0
+
+
 def test_extract_durations_raises_for_missing_header(tmp_path: Path):
     input_path = tmp_path / "input.csv"
     input_path.write_text("no_header\n1s\n", encoding="utf-8")
@@ -197,6 +243,45 @@ def test_summarize_csv_aggregates_by_dominant_date_and_time(tmp_path: Path):
     assert summary.intensity == pytest.approx(summary.observations / 90000)
 
 
+def test_summarize_csv_handles_offset_timestamps(tmp_path: Path):
+    input_path = tmp_path / "offsets.csv"
+    write_csv_with_dates(
+        input_path,
+        [
+            ("2025-10-27T08:00:00+02:00", "100ms"),
+            ("2025-10-27T09:00:00+02:00", "1s"),
+        ],
+    )
+
+    summary = summarize_csv(input_path, encoding="utf-8")
+
+    assert summary.date == "2025-10-27"
+    assert summary.observations == 2
+    assert summary.percentile_95 == 1000.0
+    assert summary.time_of_day == "Morning"
+    assert summary.intensity == pytest.approx(2 / 3600)
+
+
+def test_summarize_csv_skips_impossible_calendar_dates(tmp_path: Path):
+    input_path = tmp_path / "baddate.csv"
+    write_csv_with_dates(
+        input_path,
+        [
+            ("2025-02-29T09:00:00Z", "100ms"),
+            ("0000-01-01T09:00:00Z", "150ms"),
+            ("2025-10-27T09:00:00Z", "200ms"),
+            ("2025-10-27T10:00:00Z", "1s"),
+        ],
+    )
+
+    summary = summarize_csv(input_path, encoding="utf-8")
+
+    assert summary.observations == 2
+    assert summary.date == "2025-10-27"
+    assert summary.time_of_day == "Morning"
+    assert summary.intensity == pytest.approx(2 / 3600)
+
+
 def test_process_directory_returns_ordered_records(tmp_path: Path):
     batch_dir = tmp_path
     file_b = batch_dir / "beta.csv"